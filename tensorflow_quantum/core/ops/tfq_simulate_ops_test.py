@@ -22,176 +22,139 @@ from tensorflow_quantum.core.ops import tfq_simulate_ops
 from tensorflow_quantum.python import util
 
 
-class SimulateExpectationTest(tf.test.TestCase):
+class SimulateExpectationTest(tf.test.TestCase, parameterized.TestCase):
     """Tests tfq_simulate_expectation."""
 
-    def test_simulate_expectation_inputs(self):
+    @classmethod
+    def setUpClass(cls):
+        """Build the circuits and operators shared by the tests."""
+        super().setUpClass()
+        cls.batch_size = 5
+        cls.symbol_names = ['alpha']
+        cls.qubits = cirq.GridQubit.rect(1, 5)
+        # Input validation does not depend on circuit contents, so one
+        # random circuit is built, serialized once and tiled to a batch.
+        template_circuit = util.random_symbol_circuit(cls.qubits,
+                                                      cls.symbol_names)
+        cls.circuit_batch = [template_circuit] * cls.batch_size
+
+        # Only the shape and dtype of the values matter for these checks.
+        cls.symbol_values_array = np.broadcast_to(
+            np.array([[0.123]], dtype=np.float32),
+            (cls.batch_size, len(cls.symbol_names)))
+        cls.symbol_values_tensor = tf.constant(cls.symbol_values_array,
+                                               dtype=tf.float32)
+
+        cls.pauli_sums = util.random_pauli_sums(cls.qubits, 3, cls.batch_size)
+        cls.circuit_tensor = tf.tile(util.convert_to_tensor([template_circuit]),
+                                     [cls.batch_size])
+        cls.pauli_tensor = util.convert_to_tensor([[x] for x in cls.pauli_sums])
+
+        # Inputs with the wrong rank or batch size.
+        half_batch = int(cls.batch_size * 0.5)
+        cls.programs_rank_2 = util.convert_to_tensor([cls.circuit_batch])
+        cls.symbol_names_rank_2 = np.array([cls.symbol_names])
+        cls.symbol_values_rank_3 = np.array([cls.symbol_values_array])
+        cls.symbol_values_rank_1 = cls.symbol_values_array[0]
+        cls.pauli_sums_rank_1 = util.convert_to_tensor(list(cls.pauli_sums))
+        cls.pauli_sums_rank_3 = util.convert_to_tensor(
+            [[[x]] for x in cls.pauli_sums])
+        cls.half_pauli_sums = cls.pauli_tensor[:half_batch]
+        cls.half_symbol_values = cls.symbol_values_array[:half_batch]
+
+        # Inputs with the right type but invalid values.
+        cls.junk_programs = ['junk'] * cls.batch_size
+        cls.junk_symbol_names = ['junk']
+        cls.junk_pauli_sums = [['junk']] * cls.batch_size
+        new_qubits = [cirq.GridQubit(5, 5), cirq.GridQubit(9, 9)]
+        new_pauli_sums = util.random_pauli_sums(new_qubits, 2, cls.batch_size)
+        cls.new_pauli_tensor = util.convert_to_tensor(
+            [[x] for x in new_pauli_sums])
+        noisy_circuit = cirq.Circuit(cirq.depolarize(0.3).on_each(*cls.qubits))
+        cls.noisy_programs = tf.tile(util.convert_to_tensor([noisy_circuit]),
+                                     [cls.batch_size])
+
+        # Inputs with the wrong type.
+        cls.float_programs = [1.0] * cls.batch_size
+        cls.float_symbol_names = [0.1234]
+        cls.string_symbol_values = [['junk']] * cls.batch_size
+        cls.float_pauli_sums = [[1.0]] * cls.batch_size
+
+    # Each case replaces one op argument with the named class fixture.
+    @parameterized.named_parameters(
+        ('programs_too_many_dims', 'programs', 'programs_rank_2',
+         tf.errors.InvalidArgumentError, 'programs must be rank 1'),
+        ('symbol_names_too_many_dims', 'symbol_names', 'symbol_names_rank_2',
+         tf.errors.InvalidArgumentError, 'symbol_names must be rank 1.'),
+        ('symbol_values_too_many_dims', 'symbol_values', 'symbol_values_rank_3',
+         tf.errors.InvalidArgumentError, 'symbol_values must be rank 2.'),
+        ('symbol_values_too_few_dims', 'symbol_values', 'symbol_values_rank_1',
+         tf.errors.InvalidArgumentError, 'symbol_values must be rank 2.'),
+        ('pauli_sums_too_few_dims', 'pauli_sums', 'pauli_sums_rank_1',
+         tf.errors.InvalidArgumentError, 'pauli_sums must be rank 2.'),
+        ('pauli_sums_too_many_dims', 'pauli_sums', 'pauli_sums_rank_3',
+         tf.errors.InvalidArgumentError, 'pauli_sums must be rank 2.'),
+        ('programs_invalid_values', 'programs', 'junk_programs',
+         tf.errors.InvalidArgumentError, 'Unparseable proto'),
+        ('symbol_names_invalid_values', 'symbol_names', 'junk_symbol_names',
+         tf.errors.InvalidArgumentError,
+         'Could not find symbol in parameter map'),
+        ('pauli_sums_qubits_not_in_circuit', 'pauli_sums', 'new_pauli_tensor',
+         tf.errors.InvalidArgumentError, 'qubits not found in circuit'),
+        ('pauli_sums_invalid_values', 'pauli_sums', 'junk_pauli_sums',
+         tf.errors.InvalidArgumentError, 'Unparseable proto'),
+        ('programs_wrong_type', 'programs', 'float_programs', TypeError,
+         'Cannot convert'),
+        ('symbol_names_wrong_type', 'symbol_names', 'float_symbol_names',
+         TypeError, 'Cannot convert'),
+        ('symbol_values_wrong_type', 'symbol_values', 'string_symbol_values',
+         tf.errors.UnimplementedError, ''),
+        ('pauli_sums_wrong_type', 'pauli_sums', 'float_pauli_sums', TypeError,
+         'Cannot convert'),
+        ('wrong_op_size', 'pauli_sums', 'half_pauli_sums',
+         tf.errors.InvalidArgumentError, 'do not match'),
+        ('wrong_symbol_values_size', 'symbol_values', 'half_symbol_values',
+         tf.errors.InvalidArgumentError, 'do not match'),
+        ('noisy_circuit', 'programs', 'noisy_programs',
+         tf.errors.InvalidArgumentError, 'cirq.Channel'),
+    )
+    def test_simulate_expectation_bad_inputs(self, arg, fixture, error, regex):
         """Make sure that the expectation op fails gracefully on bad inputs."""
-        n_qubits = 5
-        batch_size = 5
-        symbol_names = ['alpha']
-        qubits = cirq.GridQubit.rect(1, n_qubits)
-        circuit_batch, resolver_batch = \
-            util.random_symbol_circuit_resolver_batch(
-                qubits, symbol_names, batch_size)
-
-        symbol_values_array = np.array(
-            [[resolver[symbol]
-              for symbol in symbol_names]
-             for resolver in resolver_batch])
-
-        pauli_sums = util.random_pauli_sums(qubits, 3, batch_size)
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    'programs must be rank 1'):
-            # Circuit tensor has too many dimensions.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor([circuit_batch]), symbol_names,
-                symbol_values_array,
-                util.convert_to_tensor([[x] for x in pauli_sums]))
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    'symbol_names must be rank 1.'):
-            # symbol_names tensor has too many dimensions.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), np.array([symbol_names]),
-                symbol_values_array,
-                util.convert_to_tensor([[x] for x in pauli_sums]))
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    'symbol_values must be rank 2.'):
-            # symbol_values_array tensor has too many dimensions.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                np.array([symbol_values_array]),
-                util.convert_to_tensor([[x] for x in pauli_sums]))
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    'symbol_values must be rank 2.'):
-            # symbol_values_array tensor has too few dimensions.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                symbol_values_array[0],
-                util.convert_to_tensor([[x] for x in pauli_sums]))
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    'pauli_sums must be rank 2.'):
-            # pauli_sums tensor has too few dimensions.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                symbol_values_array, util.convert_to_tensor(list(pauli_sums)))
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    'pauli_sums must be rank 2.'):
-            # pauli_sums tensor has too many dimensions.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                symbol_values_array,
-                util.convert_to_tensor([[[x]] for x in pauli_sums]))
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    'Unparseable proto'):
-            # circuit tensor has the right type but invalid values.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                ['junk'] * batch_size, symbol_names, symbol_values_array,
-                util.convert_to_tensor([[x] for x in pauli_sums]))
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    'Could not find symbol in parameter map'):
-            # symbol_names tensor has the right type but invalid values.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), ['junk'],
-                symbol_values_array,
-                util.convert_to_tensor([[x] for x in pauli_sums]))
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    'qubits not found in circuit'):
-            # pauli_sums tensor has the right type but invalid values.
-            new_qubits = [cirq.GridQubit(5, 5), cirq.GridQubit(9, 9)]
-            new_pauli_sums = util.random_pauli_sums(new_qubits, 2, batch_size)
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                symbol_values_array,
-                util.convert_to_tensor([[x] for x in new_pauli_sums]))
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    'Unparseable proto'):
-            # pauli_sums tensor has the right type but invalid values 2.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                symbol_values_array, [['junk']] * batch_size)
-
-        with self.assertRaisesRegex(TypeError, 'Cannot convert'):
-            # circuits tensor has the wrong type.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                [1.0] * batch_size, symbol_names, symbol_values_array,
-                util.convert_to_tensor([[x] for x in pauli_sums]))
-
-        with self.assertRaisesRegex(TypeError, 'Cannot convert'):
-            # symbol_names tensor has the wrong type.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), [0.1234],
-                symbol_values_array,
-                util.convert_to_tensor([[x] for x in pauli_sums]))
-
-        with self.assertRaisesRegex(tf.errors.UnimplementedError, ''):
-            # symbol_values tensor has the wrong type.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                [['junk']] * batch_size,
-                util.convert_to_tensor([[x] for x in pauli_sums]))
-
-        with self.assertRaisesRegex(TypeError, 'Cannot convert'):
-            # pauli_sums tensor has the wrong type.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                symbol_values_array, [[1.0]] * batch_size)
-
+        args = {
+            'programs': self.circuit_tensor,
+            'symbol_names': self.symbol_names,
+            'symbol_values': self.symbol_values_tensor,
+            'pauli_sums': self.pauli_tensor
+        }
+        args[arg] = getattr(self, fixture)
+        with self.assertRaisesRegex(error, regex):
+            tfq_simulate_ops.tfq_simulate_expectation(**args)
+
+    def test_simulate_expectation_bad_arg_count(self):
+        """Make sure that the expectation op rejects bad argument counts."""
         with self.assertRaisesRegex(TypeError, 'missing'):
             # we are missing an argument.
             # pylint: disable=no-value-for-parameter
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                symbol_values_array)
+            tfq_simulate_ops.tfq_simulate_expectation(self.circuit_tensor,
+                                                      self.symbol_names,
+                                                      self.symbol_values_tensor)
             # pylint: enable=no-value-for-parameter
 
         with self.assertRaisesRegex(TypeError, 'positional arguments'):
             # pylint: disable=too-many-function-args
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                symbol_values_array,
-                util.convert_to_tensor([[x] for x in pauli_sums]), [])
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    expected_regex='do not match'):
-            # wrong op size.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                symbol_values_array,
-                util.convert_to_tensor([[x] for x in pauli_sums
-                                       ][:int(batch_size * 0.5)]))
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    expected_regex='do not match'):
-            # wrong symbol_values size.
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor(circuit_batch), symbol_names,
-                symbol_values_array[:int(batch_size * 0.5)],
-                util.convert_to_tensor([[x] for x in pauli_sums]))
-
-        with self.assertRaisesRegex(tf.errors.InvalidArgumentError,
-                                    expected_regex='cirq.Channel'):
-            # attempting to use noisy circuit.
-            noisy_circuit = cirq.Circuit(cirq.depolarize(0.3).on_each(*qubits))
-            tfq_simulate_ops.tfq_simulate_expectation(
-                util.convert_to_tensor([noisy_circuit for _ in pauli_sums]),
-                symbol_names, symbol_values_array,
-                util.convert_to_tensor([[x] for x in pauli_sums]))
-
+            tfq_simulate_ops.tfq_simulate_expectation(self.circuit_tensor,
+                                                      self.symbol_names,
+                                                      self.symbol_values_tensor,
+                                                      self.pauli_tensor, [])
+            # pylint: enable=too-many-function-args
+
+    def test_simulate_expectation_output_dtype(self):
+        """Make sure that the expectation op down-casts to float32."""
+        # A single empty circuit is enough to check the output dtype.
         res = tfq_simulate_ops.tfq_simulate_expectation(
-            util.convert_to_tensor([cirq.Circuit() for _ in pauli_sums]),
-            symbol_names, symbol_values_array.astype(np.float64),
-            util.convert_to_tensor([[x] for x in pauli_sums]))
+            util.convert_to_tensor([cirq.Circuit()]), self.symbol_names,
+            self.symbol_values_array[:1].astype(np.float64),
+            self.pauli_tensor[:1])
         self.assertDTypeEqual(res, np.float32)
 
 
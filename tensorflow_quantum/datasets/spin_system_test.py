@@ -67,22 +67,24 @@ class TFIChainTest(tf.test.TestCase):
 
     def test_fidelity(self):
         """Test that all fidelities are close to 1."""
+        sim = cirq.Simulator()
         for nspins in self.supported_nspins_tfi_chain:
             circuits, _, _, addinfo = self.data_dict_tfi_chain[nspins]
             for n in self.random_subset_tfi_chain:
-                phi = cirq.Simulator().simulate(circuits[n]).final_state_vector
+                phi = sim.simulate(circuits[n]).final_state_vector
                 gs = addinfo[n].gs
                 self.assertAllClose(np.abs(np.vdot(gs, phi)), 1.0, rtol=1e-3)
 
     def test_paulisum(self):
         """Test that the PauliSum Hamiltonians give the ground state energy."""
+        sim = cirq.Simulator()
         for nspins in self.supported_nspins_tfi_chain:
             circuits, _, pauli_sums, addinfo = self.data_dict_tfi_chain[nspins]
             qubit_map = {
                 self.qbs_dict_tfi_chain[nspins][i]: i for i in range(nspins)
             }
             for n in self.random_subset_tfi_chain:
-                phi = cirq.Simulator().simulate(circuits[n]).final_state_vector
+                phi = sim.simulate(circuits[n]).final_state_vector
                 e = pauli_sums[n].expectation_from_state_vector(phi, qubit_map)
                 self.assertAllClose(e, addinfo[n].gs_energy, rtol=1e-4)
 
@@ -103,14 +105,14 @@ class TFIChainTest(tf.test.TestCase):
 
     def test_param_resolver(self):
         """Test that the resolved circuits are correct."""
+        sim = cirq.Simulator()
         for nspins in self.supported_nspins_tfi_chain:
             circuits, _, _, addinfo = self.data_dict_tfi_chain[nspins]
             for n in self.random_subset_tfi_chain:
                 resolved_circuit = cirq.resolve_parameters(
                     addinfo[n].var_circuit, addinfo[n].params)
-                state_circuit = cirq.Simulator().simulate(
-                    circuits[n]).final_state_vector
-                state_resolved_circuit = cirq.Simulator().simulate(
+                state_circuit = sim.simulate(circuits[n]).final_state_vector
+                state_resolved_circuit = sim.simulate(
                     resolved_circuit).final_state_vector
                 self.assertAllClose(np.abs(
                     np.vdot(state_circuit, state_resolved_circuit)),
@@ -166,22 +168,24 @@ class XXZChainTest(tf.test.TestCase):
 
     def test_fidelity(self):
         """Test that all fidelities are close to 1."""
+        sim = cirq.Simulator()
         for nspins in self.supported_nspins_xxz_chain:
             circuits, _, _, addinfo = self.data_dict_xxz_chain[nspins]
             for n in self.random_subset_xxz_chain:
-                phi = cirq.Simulator().simulate(circuits[n]).final_state_vector
+                phi = sim.simulate(circuits[n]).final_state_vector
                 gs = addinfo[n].gs
                 self.assertAllClose(np.abs(np.vdot(gs, phi)), 1.0, rtol=5e-3)
 
     def test_paulisum(self):
         """Test that the PauliSum Hamiltonians give the ground state energy."""
+        sim = cirq.Simulator()
         for nspins in self.supported_nspins_xxz_chain:
             circuits, _, pauli_sums, addinfo = self.data_dict_xxz_chain[nspins]
             qubit_map = {
                 self.qbs_dict_xxz_chain[nspins][i]: i for i in range(nspins)
             }
             for n in self.random_subset_xxz_chain:
-                phi = cirq.Simulator().simulate(circuits[n]).final_state_vector
+                phi = sim.simulate(circuits[n]).final_state_vector
                 e = pauli_sums[n].expectation_from_state_vector(phi, qubit_map)
                 self.assertAllClose(e, addinfo[n].gs_energy, rtol=5e-3)
 
@@ -202,14 +206,14 @@ class XXZChainTest(tf.test.TestCase):
 
     def test_param_resolver(self):
         """Test that the resolved circuits are correct."""
+        sim = cirq.Simulator()
         for nspins in self.supported_nspins_xxz_chain:
             circuits, _, _, addinfo = self.data_dict_xxz_chain[nspins]
             for n in self.random_subset_xxz_chain:
                 resolved_circuit = cirq.resolve_parameters(
                     addinfo[n].var_circuit, addinfo[n].params)
-                state_circuit = cirq.Simulator().simulate(
-                    circuits[n]).final_state_vector
-                state_resolved_circuit = cirq.Simulator().simulate(
+                state_circuit = sim.simulate(circuits[n]).final_state_vector
+                state_resolved_circuit = sim.simulate(
                     resolved_circuit).final_state_vector
                 self.assertAllClose(np.abs(
                     np.vdot(state_circuit, state_resolved_circuit)),
@@ -266,15 +270,17 @@ class TFIRectangularTest(tf.test.TestCase):
 
     def test_fidelity(self):
         """Test that all fidelities are close to 1."""
+        sim = cirq.Simulator()
         for nspins in self.supported_nspins_tfi_rectangular:
             circuits, _, _, addinfo = self.data_dict_tfi_rectangular[nspins]
             for n in self.random_subset_tfi_rectangular:
-                phi = cirq.Simulator().simulate(circuits[n]).final_state_vector
+                phi = sim.simulate(circuits[n]).final_state_vector
                 gs = addinfo[n].gs
                 self.assertAllClose(np.abs(np.vdot(gs, phi)), 1.0, rtol=5e-3)
 
     def test_paulisum(self):
         """Test that the PauliSum Hamiltonians give the ground state energy."""
+        sim = cirq.Simulator()
         for nspins in self.supported_nspins_tfi_rectangular:
             circuits, _, pauli_sums, addinfo = self.data_dict_tfi_rectangular[
                 nspins]
@@ -283,7 +289,7 @@ class TFIRectangularTest(tf.test.TestCase):
                 for i in range(nspins)
             }
             for n in self.random_subset_tfi_rectangular:
-                phi = cirq.Simulator().simulate(circuits[n]).final_state_vector
+                phi = sim.simulate(circuits[n]).final_state_vector
                 e = pauli_sums[n].expectation_from_state_vector(phi, qubit_map)
                 self.assertAllClose(e, addinfo[n].gs_energy, rtol=5e-3)
 
@@ -304,14 +310,14 @@ class TFIRectangularTest(tf.test.TestCase):
 
     def test_param_resolver(self):
         """Test that the resolved circuits are correct."""
+        sim = cirq.Simulator()
         for nspins in self.supported_nspins_tfi_rectangular:
             circuits, _, _, addinfo = self.data_dict_tfi_rectangular[nspins]
             for n in self.random_subset_tfi_rectangular:
                 resolved_circuit = cirq.resolve_parameters(
                     addinfo[n].var_circuit, addinfo[n].params)
-                state_circuit = cirq.Simulator().simulate(
-                    circuits[n]).final_state_vector
-                state_resolved_circuit = cirq.Simulator().simulate(
+                state_circuit = sim.simulate(circuits[n]).final_state_vector
+                state_resolved_circuit = sim.simulate(
                     resolved_circuit).final_state_vector
                 self.assertAllClose(np.abs(
                     np.vdot(state_circuit, state_resolved_circuit)),